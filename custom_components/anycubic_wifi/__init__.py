@@ -3,17 +3,73 @@
 from __future__ import annotations
 
 import logging
+import os
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import AnycubicDataUpdateCoordinator
+from .history import history_path
 
 _LOGGER = logging.getLogger(__name__)
 
-_PLATFORMS: list[Platform] = [Platform.BUTTON, Platform.IMAGE, Platform.LIGHT, Platform.SENSOR]
+_PLATFORMS: list[Platform] = [Platform.BUTTON, Platform.IMAGE, Platform.LIGHT, Platform.SELECT, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_GET_PRINT_HISTORY = "get_print_history"
+GET_PRINT_HISTORY_SCHEMA = vol.Schema({
+    vol.Optional("config_entry_id"): cv.string,
+    vol.Optional("start"): cv.datetime,
+    vol.Optional("end"): cv.datetime,
+    vol.Optional("filename"): cv.string,
+})
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the integration services."""
+
+    async def _get_print_history(call: ServiceCall) -> ServiceResponse:
+        start = call.data.get("start")
+        end = call.data.get("end")
+        entry_id = call.data.get("config_entry_id")
+        coordinators = hass.data.get(DOMAIN, {})
+        if entry_id and entry_id not in coordinators:
+            raise ServiceValidationError(f"No loaded Anycubic printer with config entry id {entry_id}")
+        response = {}
+        for coordinator_entry_id, coordinator in coordinators.items():
+            if entry_id and coordinator_entry_id != entry_id:
+                continue
+            history = coordinator.history
+            records = history.query(
+                dt_util.as_utc(start).timestamp() if start else None,
+                dt_util.as_utc(end).timestamp() if end else None,
+                call.data.get("filename"),
+            )
+            response[coordinator_entry_id] = {
+                "jobs": [record.as_dict() for record in records],
+                "total_print_time": history.total_duration,
+                "total_usage": history.total_usage,
+                "slot_usage": dict(history.slot_totals),
+            }
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PRINT_HISTORY,
+        _get_print_history,
+        schema=GET_PRINT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -23,7 +79,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data.get("host")
 
     # Create the coordinator (handles polling and updating credentials)
-    coordinator = AnycubicDataUpdateCoordinator(hass, host)
+    coordinator = AnycubicDataUpdateCoordinator(hass, host, entry.entry_id)
+    await coordinator.history.async_load()
     await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -40,3 +97,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the print history of a removed config entry."""
+    path = history_path(hass, entry.entry_id)
+
+    def _remove():
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    await hass.async_add_executor_job(_remove)
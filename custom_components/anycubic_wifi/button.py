@@ -21,6 +21,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
     for name, axis in HOMING_BUTTONS:
         entities.append(AnycubicHomeButton(coordinator, name, axis))
 
+    entities.append(AnycubicRefreshFilesButton(coordinator))
+
     async_add_entities(entities)
 
 
@@ -43,3 +45,14 @@ class AnycubicHomeButton(CoordinatorEntity, ButtonEntity):
         }
         topic = self.coordinator.mqtt.web_topic("axis")
         self.coordinator.mqtt.publish_json(topic, payload)
+
+
+class AnycubicRefreshFilesButton(CoordinatorEntity, ButtonEntity):
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Anycubic Refresh Files"
+        self._attr_unique_id = "anycubic_refresh_files"
+
+    async def async_press(self) -> None:
+        if self.coordinator.files:
+            await self.coordinator.files.async_refresh()
@@ -7,13 +7,15 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from .api import AnycubicAPI
 from .const import DOMAIN
+from .files import AnycubicFileBrowser
+from .history import AnycubicPrintHistory, history_path
 from .mqtt import AnycubicMQTT
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class AnycubicDataUpdateCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, host):
+    def __init__(self, hass, host, entry_id):
         super().__init__(
             hass,
             _LOGGER,
@@ -22,9 +24,12 @@ class AnycubicDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.api: AnycubicAPI | None = None
         self.mqtt: AnycubicMQTT | None = None
+        self.files: AnycubicFileBrowser | None = None
         self._host: str = host
         self._current_creds = None
         self._current_slots = set()
+        self._last_print_msg = None
+        self.history = AnycubicPrintHistory(hass, history_path(hass, entry_id))
 
     def async_set_updated_data(self, data):
         """Callback to set updated data from MQTT."""
@@ -42,6 +47,12 @@ class AnycubicDataUpdateCoordinator(DataUpdateCoordinator):
             self._current_slots.update(new_slots)
             async_dispatcher_send(self.hass, f"{DOMAIN}_new_slots", new_slots)
 
+        # Only feed the history when a new print message arrived
+        print_msg = data.get("print")
+        if print_msg is not None and print_msg is not self._last_print_msg:
+            self._last_print_msg = print_msg
+            self.history.process(print_msg)
+
         super().async_set_updated_data(data)
 
     async def _async_update_data(self):
@@ -67,6 +78,10 @@ class AnycubicDataUpdateCoordinator(DataUpdateCoordinator):
             topic = self.mqtt.web_topic("multiColorBox")
             self.mqtt.publish_json(topic, payload)
 
+        # The file list is only pulled until the first listing succeeded, later on demand
+        if self.files and not self.files.loaded:
+            self.hass.async_create_task(self.files.async_refresh())
+
         return self.data or {}
 
     async def _async_init_mqtt(self, data):
@@ -86,6 +101,7 @@ class AnycubicDataUpdateCoordinator(DataUpdateCoordinator):
             data["deviceId"],
         )
         self.mqtt.on_update = self.async_set_updated_data
+        self.files = AnycubicFileBrowser(self.hass, self.mqtt)
 
         await self.hass.async_add_executor_job(self.mqtt.connect)
 
@@ -0,0 +1,202 @@
+import asyncio
+import base64
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DOMAIN
+from .mqtt import AnycubicMQTT
+
+_LOGGER = logging.getLogger(__name__)
+
+FILE_PAGE_SIZE = 50
+MAX_FILE_PAGES = 40
+THUMBNAIL_CACHE_SIZE = 20
+REQUEST_TIMEOUT = 10
+
+
+@dataclass(frozen=True)
+class PrinterFile:
+    """Metadata of one sliced file stored on the printer."""
+
+    filename: str
+    path: str | None = None
+    size: int | None = None
+    timestamp: int | None = None
+
+
+class AnycubicFileBrowser:
+    """
+    Paged index of the files stored on the printer.
+    Lists files over the `file` endpoint one page at a time, keeps metadata keyed by
+    filename and fetches thumbnails only for the file being viewed, caching the most
+    recent ones in a bounded LRU.
+    """
+
+    def __init__(self, hass: HomeAssistant, mqtt: AnycubicMQTT):
+        self.hass = hass
+        self.mqtt = mqtt
+
+        self.files: dict[str, PrinterFile] = {}
+        self.filenames: list[str] = []
+        self.selected: str | None = None
+        self.loaded = False
+
+        # Keyed by (filename, timestamp) so a re-uploaded file does not show a stale thumbnail
+        self._thumbnails: OrderedDict[tuple, bytes] = OrderedDict()
+        self._thumbnail_tasks: dict[tuple, asyncio.Task] = {}
+        self._refresh_lock = asyncio.Lock()
+
+    async def async_refresh(self):
+        """Rebuild the file index page by page, keeping the old index if listing fails."""
+        if self._refresh_lock.locked():
+            return
+        async with self._refresh_lock:
+            files = {}
+            seen = set()  # every entry the printer returned, directories included
+            total = None
+            for page in range(1, MAX_FILE_PAGES + 1):
+                try:
+                    data = await self._async_request(
+                        "listLocal", {"path": "/", "page": page, "limit": FILE_PAGE_SIZE}
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("Timed out listing printer files (page %s)", page)
+                    return
+                if data is None:
+                    _LOGGER.debug("Printer rejected file listing (page %s)", page)
+                    return
+                if isinstance(data, dict):
+                    records = data.get("records")
+                    total = data.get("total")
+                else:
+                    records = data
+                    total = None
+                if not isinstance(records, list):
+                    _LOGGER.debug("Unexpected file listing reply: %s", data)
+                    return
+
+                new_entries = 0
+                for record in records:
+                    entry = _entry_key(record)
+                    if entry not in seen:
+                        seen.add(entry)
+                        new_entries += 1
+                    if not isinstance(record, dict) or record.get("is_dir"):
+                        continue
+                    filename = record.get("filename")
+                    if filename:
+                        files[filename] = PrinterFile(
+                            filename=filename,
+                            path=record.get("path"),
+                            size=record.get("size"),
+                            timestamp=record.get("timestamp"),
+                        )
+                # A page without new entries means the printer ignores paging and repeats itself
+                if new_entries == 0:
+                    break
+                if isinstance(total, int):
+                    if len(seen) >= total:
+                        break
+                elif len(seen) < page * FILE_PAGE_SIZE:
+                    # Without a total, a short page is the last one
+                    break
+            else:
+                _LOGGER.warning("Printer file list exceeds %s pages, index is incomplete", MAX_FILE_PAGES)
+            if isinstance(total, int) and len(seen) < total:
+                _LOGGER.warning("Printer reported %s files but only %s were listed", total, len(seen))
+
+            # Drop cached thumbnails of files that are gone or changed
+            for key in list(self._thumbnails):
+                filename, timestamp = key
+                if filename not in files or files[filename].timestamp != timestamp:
+                    del self._thumbnails[key]
+            if self.selected not in files:
+                self.selected = None
+            self.files = files
+            self.filenames = sorted(files)
+            self.loaded = True
+        async_dispatcher_send(self.hass, f"{DOMAIN}_files_updated")
+
+    def select(self, filename: str):
+        """Mark a file as the one being viewed."""
+        if filename not in self.files:
+            raise ValueError(f"Unknown printer file: {filename}")
+        self.selected = filename
+        async_dispatcher_send(self.hass, f"{DOMAIN}_file_selected", filename)
+
+    async def async_get_thumbnail(self, filename: str) -> bytes | None:
+        """Return the decoded thumbnail of a file, fetching it on first view."""
+        file = self.files.get(filename)
+        key = (filename, file.timestamp if file else None)
+        if key in self._thumbnails:
+            self._thumbnails.move_to_end(key)
+            return self._thumbnails[key]
+
+        # Concurrent views of the same file share a single request
+        task = self._thumbnail_tasks.get(key)
+        if task is None:
+            task = self.hass.async_create_task(self._async_fetch_thumbnail(key))
+            self._thumbnail_tasks[key] = task
+            task.add_done_callback(lambda _: self._thumbnail_tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch_thumbnail(self, key: tuple) -> bytes | None:
+        filename = key[0]
+        try:
+            data = await self._async_request("getFileDetails", {"root": "local", "filename": filename})
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timed out fetching thumbnail for %s", filename)
+            return None
+
+        details = data.get("file_details") if isinstance(data, dict) else None
+        thumb_b64 = details.get("thumbnail") if isinstance(details, dict) else None
+        if not thumb_b64:
+            return None
+        try:
+            image = base64.b64decode(thumb_b64)
+        except Exception:
+            _LOGGER.warning("Could not decode thumbnail base64 for %s", filename)
+            return None
+
+        self._thumbnails[key] = image
+        while len(self._thumbnails) > THUMBNAIL_CACHE_SIZE:
+            self._thumbnails.popitem(last=False)
+        return image
+
+    async def _async_request(self, action: str, data: dict):
+        """
+        Publish a `file` request and wait for the reply carrying the same msgid.
+        Returns the reply data, or None when the printer reports a failure.
+        """
+        msgid = str(uuid.uuid4())
+        future = self.hass.loop.create_future()
+
+        def _on_response(message):
+            if not future.done():
+                future.set_result(message)
+
+        self.mqtt.expect_response(msgid, _on_response)
+        payload = {"type": "file", "action": action, "msgid": msgid, "data": data}
+        self.mqtt.publish_json(self.mqtt.web_topic("file"), payload)
+        try:
+            message = await asyncio.wait_for(future, REQUEST_TIMEOUT)
+        finally:
+            self.mqtt.cancel_response(msgid)
+
+        if message.get("state") in ("failed", "error") or message.get("code") not in (None, 200):
+            _LOGGER.debug("File request %s failed: %s", action, message)
+            return None
+        return message.get("data")
+
+
+def _entry_key(record) -> str:
+    """Identity of a listing entry, used to notice pages that return nothing new."""
+    if isinstance(record, dict) and record.get("filename"):
+        return f"{record.get('path') or ''}/{record['filename']}"
+    return json.dumps(record, sort_keys=True, default=str)
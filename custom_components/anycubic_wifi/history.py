@@ -0,0 +1,243 @@
+import asyncio
+import bisect
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Printer states reported on the `print` stream while a job is in progress
+ACTIVE_STATES = {
+    "downloading", "checking", "preheating", "printing", "paused", "pausing", "resuming", "resumed",
+    "stoping", "stopping",
+}
+# Printer states that close a job
+FINAL_STATES = {"finished", "stoped", "stopped", "canceled", "cancelled", "failed"}
+# `print_time` on the `print` stream is reported in minutes
+PRINT_TIME_SECONDS = 60
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Location of the history file of a config entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history.jsonl")
+
+
+@dataclass(frozen=True)
+class PrintJobRecord:
+    """One finished print job as stored in the history file."""
+
+    start: float
+    end: float
+    filename: str | None
+    status: str
+    usage: dict[str, float] = field(default_factory=dict)
+    total_usage: float = 0.0
+    taskid: str | None = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "duration": self.duration}
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "PrintJobRecord":
+        raw = json.loads(line)
+        usage = {str(k): float(v) for k, v in (raw.get("usage") or {}).items()}
+        # Older lines kept a scalar `supplies_usage` under a pseudo slot
+        legacy_total = usage.pop("total", None)
+        total_usage = raw.get("total_usage")
+        if total_usage is None:
+            total_usage = legacy_total if legacy_total is not None else sum(usage.values())
+        return cls(
+            start=float(raw["start"]),
+            end=float(raw["end"]),
+            filename=raw.get("filename"),
+            status=raw["status"],
+            usage=usage,
+            total_usage=float(total_usage),
+            taskid=raw.get("taskid"),
+        )
+
+
+class AnycubicPrintHistory:
+    """
+    Append-only print job ledger for one printer.
+    Watches the `print` stream for job start/finish transitions, appends one JSON line
+    per finished job and keeps in-memory indexes by end time and filename, plus
+    running filament usage totals overall and per slot. Exposed through the `get_print_history` service.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str):
+        self.hass = hass
+        self.path = path
+
+        self.records: list[PrintJobRecord] = []
+        self.slot_totals: dict[str, float] = {}
+        self.total_usage = 0.0
+        self.total_duration = 0.0
+        self._ends: list[float] = []
+        self._by_filename: dict[str | None, list[int]] = {}
+        self._task_ids: set[str] = set()
+        self._write_lock = asyncio.Lock()
+
+        self._job_key = None
+        self._job_start: float | None = None
+        self._last_print: dict = {}
+
+    async def async_load(self):
+        """Read the history file and rebuild the indexes."""
+        lines = await self.hass.async_add_executor_job(self._read_lines)
+        for line in lines:
+            try:
+                record = PrintJobRecord.from_json(line)
+            except (ValueError, KeyError, TypeError):
+                _LOGGER.warning("Skipping malformed print history line: %s", line)
+                continue
+            self._index(record)
+
+    def process(self, print_msg: dict):
+        """Inspect the latest `print` message and record a job when it finishes."""
+        # Same job state the print status sensor shows, `state` only as a fallback
+        state = print_msg.get("__state__") or print_msg.get("state")
+        data = print_msg.get("data") or {}
+        key = data.get("taskid") or data.get("filename")
+
+        if state in ACTIVE_STATES:
+            if self._job_start is None or (key and key != self._job_key):
+                self._job_key = key
+                # Prefer the printer's own elapsed time, HA may have joined mid-print
+                self._job_start = _start_from_print_time(data, time.time())
+                self._last_print = {}
+            # Later messages of the same job may only carry the fields that changed
+            self._last_print = {**self._last_print, **data}
+        elif state in FINAL_STATES:
+            # The final message may already be stripped down, fall back to the last known data
+            merged = {**self._last_print, **data}
+            taskid = merged.get("taskid")
+            taskid = str(taskid) if taskid is not None else None
+            if self._job_start is None and (taskid is None or taskid in self._task_ids):
+                # Nothing started since the last record, or this task is already stored
+                return
+            end = time.time()
+            usage, total_usage = _parse_usage(merged.get("supplies_usage"))
+            record = PrintJobRecord(
+                start=self._job_start if self._job_start is not None else _start_from_print_time(merged, end),
+                end=end,
+                filename=merged.get("filename"),
+                status=state,
+                usage=usage,
+                total_usage=total_usage,
+                taskid=taskid,
+            )
+            self._job_key = None
+            self._job_start = None
+            self._last_print = {}
+            if taskid is not None:
+                self._task_ids.add(taskid)
+            self.hass.async_create_task(self._async_append(record))
+
+    def query(self, start: float | None = None, end: float | None = None,
+              filename: str | None = None) -> list[PrintJobRecord]:
+        """Jobs that finished within [start, end], optionally only for one file."""
+        if filename is not None:
+            return [
+                record for record in self.for_filename(filename)
+                if (start is None or record.end >= start) and (end is None or record.end <= end)
+            ]
+        return self.between(start if start is not None else float("-inf"),
+                            end if end is not None else float("inf"))
+
+    def between(self, start: float, end: float) -> list[PrintJobRecord]:
+        """Jobs that finished within [start, end] (unix timestamps)."""
+        lo = bisect.bisect_left(self._ends, start)
+        hi = bisect.bisect_right(self._ends, end)
+        return self.records[lo:hi]
+
+    def for_filename(self, filename: str) -> list[PrintJobRecord]:
+        """Jobs that printed the given file, oldest first."""
+        return [self.records[i] for i in self._by_filename.get(filename, [])]
+
+    async def _async_append(self, record: PrintJobRecord):
+        # One writer at a time keeps the file in finish order
+        async with self._write_lock:
+            try:
+                await self.hass.async_add_executor_job(self._append_line, record.to_json())
+            except OSError as err:
+                _LOGGER.error("Could not write print history to %s: %s", self.path, err)
+                return
+            self._index(record)
+
+    def _index(self, record: PrintJobRecord):
+        # Records are appended in finish order, so the end-time index stays sorted
+        pos = bisect.bisect_right(self._ends, record.end)
+        if pos != len(self._ends):
+            self._ends.insert(pos, record.end)
+            self.records.insert(pos, record)
+            self._rebuild_filename_index()
+        else:
+            self._ends.append(record.end)
+            self.records.append(record)
+            self._by_filename.setdefault(record.filename, []).append(pos)
+        self.total_duration += record.duration
+        self.total_usage += record.total_usage
+        if record.taskid is not None:
+            self._task_ids.add(record.taskid)
+        for slot, amount in record.usage.items():
+            self.slot_totals[slot] = self.slot_totals.get(slot, 0.0) + amount
+
+    def _rebuild_filename_index(self):
+        self._by_filename = {}
+        for i, record in enumerate(self.records):
+            self._by_filename.setdefault(record.filename, []).append(i)
+
+    def _read_lines(self) -> list[str]:
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                return [line for line in (raw.strip() for raw in fp) if line]
+        except FileNotFoundError:
+            return []
+
+    def _append_line(self, line: str):
+        with open(self.path, "a", encoding="utf-8") as fp:
+            fp.write(line + "\n")
+
+
+def _start_from_print_time(data: dict, now: float) -> float:
+    """Job start derived from the elapsed `print_time`, or *now* when it is unknown."""
+    print_time = data.get("print_time")
+    if isinstance(print_time, (int, float)) and print_time > 0:
+        return now - print_time * PRINT_TIME_SECONDS
+    return now
+
+
+def _parse_usage(usage) -> tuple[dict[str, float], float]:
+    """
+    Split `supplies_usage` into ({slot: amount}, total amount).
+    A plain number is an overall amount without a slot breakdown. Per-slot usage is
+    accepted as {slot: amount} or as a list of {"index"|"slot": ..., "usage"|"used": ...}.
+    """
+    if isinstance(usage, (int, float)):
+        return {}, float(usage)
+    slots = {}
+    if isinstance(usage, dict):
+        slots = {str(k): float(v) for k, v in usage.items() if isinstance(v, (int, float))}
+    elif isinstance(usage, list):
+        for item in usage:
+            if not isinstance(item, dict):
+                continue
+            slot = item.get("index", item.get("slot"))
+            amount = item.get("usage", item.get("used"))
+            if slot is not None and isinstance(amount, (int, float)):
+                slots[str(slot)] = slots.get(str(slot), 0.0) + float(amount)
+    return slots, sum(slots.values())
@@ -2,8 +2,10 @@ import base64
 import logging
 
 from homeassistant.components.image import ImageEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import AnycubicDataUpdateCoordinator
@@ -16,6 +18,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     async_add_entities([
         AnycubicThumbnailImage(hass, coordinator),
+        AnycubicFileThumbnailImage(hass, coordinator),
     ])
 
 
@@ -40,3 +43,48 @@ class AnycubicThumbnailImage(ImageEntity, CoordinatorEntity):
             except Exception:
                 _LOGGER.warning("Could not decode thumbnail base64")
         return None
+
+
+class AnycubicFileThumbnailImage(ImageEntity, CoordinatorEntity):
+    def __init__(self, hass: HomeAssistant, coordinator: AnycubicDataUpdateCoordinator):
+        super().__init__(hass)
+        super(CoordinatorEntity, self).__init__(coordinator)
+
+        self._attr_name = "Anycubic File Thumbnail"
+        self._attr_unique_id = "anycubic_file_thumbnail_image"
+        self._shown = None  # (filename, timestamp) of the file the image currently represents
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, f"{DOMAIN}_file_selected", self._handle_file_selected)
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, f"{DOMAIN}_files_updated", self._handle_files_updated)
+        )
+
+    @callback
+    def _handle_file_selected(self, filename):
+        self._update_shown(force=True)
+
+    @callback
+    def _handle_files_updated(self):
+        # A refresh can clear the selection or bring a re-uploaded file with a new thumbnail
+        self._update_shown(force=False)
+
+    @callback
+    def _update_shown(self, force: bool):
+        files = self.coordinator.files
+        selected = files.files.get(files.selected) if files and files.selected else None
+        shown = (selected.filename, selected.timestamp) if selected else None
+        if force or shown != self._shown:
+            self._shown = shown
+            self._attr_image_last_updated = dt_util.utcnow()
+            self.async_write_ha_state()
+
+    async def async_image(self):
+        # Only the viewed file's thumbnail is fetched, the browser caches recent ones
+        files = self.coordinator.files
+        if not files or not files.selected:
+            return None
+        return await files.async_get_thumbnail(files.selected)
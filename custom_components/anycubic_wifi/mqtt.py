@@ -26,6 +26,7 @@ class AnycubicMQTT:
         self.on_update = on_update  # Callback assigned by the coordinator
 
         self.state = {}
+        self._responses = {}  # msgid -> callback for request/reply style messages
         self.client = mqtt.Client()
         # do not call tls_set or connect here to avoid blocking in event loop
         self.client.on_connect = self._on_connect
@@ -55,6 +56,13 @@ class AnycubicMQTT:
             retain,
         )
 
+    def expect_response(self, msgid: str, callback) -> None:
+        """Route the reply carrying *msgid* to *callback* instead of the shared state."""
+        self._responses[msgid] = callback
+
+    def cancel_response(self, msgid: str) -> None:
+        self._responses.pop(msgid, None)
+
     def printer_topic(self, endpoint: str) -> str:
         """Topic for printer state updates."""
         return (
@@ -85,7 +93,10 @@ class AnycubicMQTT:
             data = json.loads(payload)
             _LOGGER.debug("MQTT Message: %s -> %s", msg.topic, payload)
 
-            if "type" in data:
+            callback = self._responses.pop(data.get("msgid"), None)
+            if callback:
+                self.hass.loop.call_soon_threadsafe(callback, data)
+            elif "type" in data:
                 self.state[data["type"]] = data
                 if self.on_update:
                     self.hass.loop.call_soon_threadsafe(self.on_update, self.state)
@@ -0,0 +1,55 @@
+import logging
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+
+    async_add_entities([
+        AnycubicFileSelect(coordinator),
+    ])
+
+
+class AnycubicFileSelect(CoordinatorEntity, SelectEntity):
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Anycubic File"
+        self._attr_unique_id = "anycubic_file_select"
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, f"{DOMAIN}_files_updated", self.async_write_ha_state)
+        )
+
+    @property
+    def options(self) -> list[str]:
+        files = self.coordinator.files
+        return files.filenames if files else []
+
+    @property
+    def current_option(self) -> str | None:
+        files = self.coordinator.files
+        return files.selected if files else None
+
+    @property
+    def extra_state_attributes(self):
+        files = self.coordinator.files
+        selected = files.files.get(files.selected) if files and files.selected else None
+        return {
+            "file_count": len(files.files) if files else 0,
+            "path": selected.path if selected else None,
+            "size": selected.size if selected else None,
+            "timestamp": selected.timestamp if selected else None,
+        }
+
+    async def async_select_option(self, option: str) -> None:
+        self.coordinator.files.select(option)
+        self.async_write_ha_state()
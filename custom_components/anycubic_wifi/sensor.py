@@ -17,6 +17,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         AnycubicHotbedTempSensor(coordinator),
         AnycubicPrintJobSensor(coordinator),
         AnycubicSlotsSensor(coordinator),
+        AnycubicPrintHistorySensor(coordinator),
     ]
     async_add_entities(entities)
 
@@ -85,6 +86,11 @@ class AnycubicHotbedTempSensor(CoordinatorEntity, SensorEntity):
 
 
 class AnycubicPrintJobSensor(CoordinatorEntity, SensorEntity):
+    # Change with every message, finished jobs are kept in the print history instead
+    _unrecorded_attributes = frozenset({
+        "progress", "curr_layer", "total_layers", "remain_time", "print_time", "filename", "supplies_usage",
+    })
+
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_name = "Anycubic Print Status"
@@ -135,3 +141,27 @@ class AnycubicSlotsSensor(CoordinatorEntity, SensorEntity):
                     "sku": slot.get("sku"),
                 })
         return all_slots
+
+
+class AnycubicPrintHistorySensor(CoordinatorEntity, SensorEntity):
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Anycubic Print History"
+        self._attr_unique_id = "anycubic_print_history"
+
+    @property
+    def native_value(self):
+        return len(self.coordinator.history.records)
+
+    @property
+    def extra_state_attributes(self):
+        history = self.coordinator.history
+        last = history.records[-1] if history.records else None
+        return {
+            "total_print_time": history.total_duration,
+            "total_usage": history.total_usage,
+            "slot_usage": dict(history.slot_totals),
+            "last_filename": last.filename if last else None,
+            "last_status": last.status if last else None,
+            "last_duration": last.duration if last else None,
+        }